@@ -1,23 +1,55 @@
 """The GWM Car Info integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
+import random
+from datetime import datetime, timedelta, timezone
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-import requests
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, UPDATE_INTERVAL
+from .const import (
+    DOMAIN,
+    MAX_UPDATE_INTERVAL,
+    SERVICE_REFRESH,
+    STABLE_POLLS_BEFORE_BACKOFF,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_JITTER,
+)
 from .gwm_api import GWMCarInfoClient
+from .utils import async_load_device_id
 
 _LOGGER = logging.getLogger(__name__)
 
 # Платформы которые поддерживает интеграция
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.DEVICE_TRACKER]
 
+# Настройка только через UI (config entries)
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the GWM Car Info integration."""
+
+    # Сервис принудительного обновления регистрируем один раз для интеграции,
+    # чтобы он существовал даже если ни одна запись не поднялась
+    async def _async_handle_refresh(call: ServiceCall) -> None:
+        """Force refresh of all GWM coordinators, bypassing the poll interval."""
+        for coordinator in list(hass.data.get(DOMAIN, {}).values()):
+            await coordinator.async_force_refresh()
+
+    hass.services.async_register(DOMAIN, SERVICE_REFRESH, _async_handle_refresh)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up GWM Car Info from a config entry."""
@@ -27,30 +59,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     password = entry.data["password"]
     vin = entry.data["vin"]
     model = entry.data["model"]
+    vehicle_number = entry.data.get("vehicle_number")
     
-    # Создаем API клиент
+    # Создаем API клиент; его HTTP-сессия закрывается при выгрузке записи
     client = GWMCarInfoClient()
-    # Переносим device_id в безопасную директорию конфигурации HA (.storage)
-    device_id_path = hass.config.path(".storage/gwm_car_info_device_id.txt")
-    client.device_id_file = device_id_path
-    # Загружаем / создаем device_id НЕ в event loop
-    client.device_id = await hass.async_add_executor_job(client.load_device_id)
-    
-    # Проверяем SSL сертификаты
-    ssl_ok = client.setup_ssl_certificates()
+    entry.async_on_unload(client.async_close)
+    # device_id хранится в .storage через Store; SSL сертификаты проверяем
+    # НЕ в event loop, параллельно — задачи независимы друг от друга
+    client.device_id, ssl_ok = await asyncio.gather(
+        async_load_device_id(hass),
+        hass.async_add_executor_job(client.setup_ssl_certificates),
+    )
     if not ssl_ok:
         _LOGGER.warning("SSL сертификаты не найдены! API может не работать без них.")
     else:
         _LOGGER.info("SSL сертификаты успешно загружены")
     
     # Создаем координатор для обновления данных
+    store = Store(hass, STORAGE_VERSION, _storage_key(entry))
     coordinator = GWMDataUpdateCoordinator(
-        hass, client, email, password, vin, model
+        hass, client, email, password, vin, model, vehicle_number, store
     )
     coordinator.config_entry = entry
     
-    # Первоначальная загрузка данных
-    await coordinator.async_config_entry_first_refresh()
+    # Первоначальная загрузка данных: если есть сохраненный ответ API, поднимаем
+    # сущности сразу на нем, а свежие данные запрашиваем в фоне
+    cached_vehicle_data = await store.async_load()
+    if cached_vehicle_data:
+        coordinator.async_set_updated_data(coordinator.build_data(cached_vehicle_data))
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} initial refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
     
     # Сохраняем координатор в hass.data
     hass.data.setdefault(DOMAIN, {})
@@ -69,6 +110,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove cached API data when a config entry is deleted."""
+    await Store(hass, STORAGE_VERSION, _storage_key(entry)).async_remove()
+
+
+def _storage_key(entry: ConfigEntry) -> str:
+    """Return the .storage key for the cached API payload of an entry."""
+    return f"{DOMAIN}.{entry.entry_id}"
+
+
 class GWMDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the GWM API."""
 
@@ -80,6 +131,8 @@ class GWMDataUpdateCoordinator(DataUpdateCoordinator):
         password: str,
         vin: str,
         model: str,
+        vehicle_number: str | None = None,
+        store: Store | None = None,
     ) -> None:
         """Initialize."""
         self.client = client
@@ -87,66 +140,160 @@ class GWMDataUpdateCoordinator(DataUpdateCoordinator):
         self.password = password
         self.vin = vin
         self.model = model
+        self.vehicle_number = vehicle_number
+        self._store = store
         self.config_entry = None  # установим позже из async_setup_entry
+        # Состояние адаптивного опроса
+        self._last_parsed: dict | None = None
+        self._stable_polls = 0
+        self._last_poll_failed = False
+        # Плоский вид self.data (parsed_data + верхний уровень) для value()
+        self._flat: dict = {}
+        self._flat_source: dict | None = None
         
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            # Неизменившиеся данные не перезаписывают состояние всех сущностей
+            always_update=False,
         )
 
+    async def async_force_refresh(self) -> None:
+        """Refresh now and reset the adaptive interval to the base value."""
+        self._stable_polls = 0
+        self.update_interval = timedelta(seconds=UPDATE_INTERVAL)
+        await self.async_refresh()
+
     async def _async_update_data(self):
-        """Update data via library."""
+        """Update data via library and adapt the polling interval."""
         try:
-            # Проверяем авторизацию
-            if not self.client.access_token:
-                login_success = await self.hass.async_add_executor_job(
-                    self.client.login, self.email, self.password
+            data = await self._async_fetch_data()
+        except UpdateFailed:
+            # Экспоненциальный backoff при ошибках, чтобы не долбить API
+            self._last_poll_failed = True
+            self._backoff_update_interval()
+            raise
+        if self._last_poll_failed:
+            # API снова отвечает: сбрасываем backoff ошибок, даже если данные не изменились
+            self._last_poll_failed = False
+            self._last_parsed = data["parsed_data"]
+            self._stable_polls = 0
+            self.update_interval = _jittered_interval(UPDATE_INTERVAL)
+        else:
+            self._adapt_update_interval(data["parsed_data"])
+        return data
+
+    def _adapt_update_interval(self, parsed_data: dict) -> None:
+        """Stretch the interval while state is stable, snap back on changes."""
+        if parsed_data != self._last_parsed:
+            self._last_parsed = parsed_data
+            self._stable_polls = 0
+            self.update_interval = _jittered_interval(UPDATE_INTERVAL)
+            return
+
+        self._stable_polls += 1
+        if self._stable_polls >= STABLE_POLLS_BEFORE_BACKOFF:
+            self._backoff_update_interval()
+
+    def _backoff_update_interval(self) -> None:
+        """Double the polling interval up to MAX_UPDATE_INTERVAL."""
+        current = self.update_interval.total_seconds()
+        self.update_interval = _jittered_interval(current * 2)
+
+    async def _async_fetch_data(self):
+        """Fetch and parse vehicle data from the API."""
+        try:
+            # Получаем данные автомобиля; без токена сначала логинимся
+            if self.client.access_token:
+                vehicle_data = await self.client.get_vehicle_by_vin(self.vin)
+            else:
+                vehicle_data = await self.client.login_and_get_vehicle(
+                    self.email, self.password, self.vin
                 )
-                if not login_success:
+                if not self.client.access_token:
                     raise UpdateFailed("Ошибка авторизации")
             
-            # Получаем данные автомобиля
-            vehicle_data = await self.hass.async_add_executor_job(
-                self.client.get_vehicle_by_vin, self.vin
-            )
-            
             # Если данные не получены, пробуем переавторизоваться и повторить один раз
             if vehicle_data is None:
                 _LOGGER.debug("Primary fetch failed, trying to re-login and refetch")
-                relogin_ok = await self.hass.async_add_executor_job(
-                    self.client.login, self.email, self.password
+                vehicle_data = await self.client.login_and_get_vehicle(
+                    self.email, self.password, self.vin
                 )
-                if relogin_ok:
-                    vehicle_data = await self.hass.async_add_executor_job(
-                        self.client.get_vehicle_by_vin, self.vin
-                    )
                 if vehicle_data is None:
                     raise UpdateFailed("Не удалось получить данные автомобиля")
             
-            # Парсим данные из items (items находится на верхнем уровне!)
-            items = vehicle_data.get("items", [])
-            parsed_data = self.client.parse_vehicle_items(items)
+            data = self.build_data(vehicle_data)
             
-            # Объединяем все данные
-            return {
-                "raw_data": vehicle_data,
-                "parsed_data": parsed_data,
-                "vin": self.vin,
-                "model": self.model,
-                "vehicleNumber": self.hass.config_entries.async_get_entry(self.config_entry.entry_id).data.get("vehicle_number"),
-                "latitude": vehicle_data.get("latitude"),
-                "longitude": vehicle_data.get("longitude"),
-                "location_accuracy": _extract_location_accuracy(vehicle_data),
-                "update_time": vehicle_data.get("updateTime"),
-                "service_status": vehicle_data.get("serviceStatus"),
-                # "oil_qty": vehicle_data.get("oilQty"),  # не используется — убрано
-            }
-            
-        except (requests.exceptions.RequestException, ValueError, KeyError, TimeoutError) as exception:
+        except (aiohttp.ClientError, OSError, ValueError, KeyError, TimeoutError) as exception:
             raise UpdateFailed(f"Ошибка обновления данных: {exception}") from exception
 
+        # Сохраняем ответ для быстрого старта после перезапуска HA — только если
+        # он изменился, чтобы стоящая машина не перезаписывала .storage каждый опрос
+        if self._store is not None and data != self.data:
+            self._store.async_delay_save(lambda: vehicle_data, STORAGE_SAVE_DELAY)
+        return data
+
+    def value(self, key: str):
+        """Return a value from the latest payload by its flat key.
+
+        parsed_data and top-level fields share one namespace; the flat dict is
+        rebuilt only when coordinator data is replaced.
+        """
+        data = self.data
+        if data is not self._flat_source:
+            self._flat_source = data
+            self._flat = {**data, **data["parsed_data"]} if data else {}
+        return self._flat.get(key)
+
+    def build_data(self, vehicle_data: dict) -> dict:
+        """Build coordinator data from a getLastStatus API payload."""
+        # Парсим данные из items (items находится на верхнем уровне!)
+        items = vehicle_data.get("items", [])
+        parsed_data = self.client.parse_vehicle_items(items)
+        
+        # Верхнеуровневые поля ответа читаем один раз
+        latitude = vehicle_data.get("latitude")
+        longitude = vehicle_data.get("longitude")
+        update_time = vehicle_data.get("updateTime")
+        service_status = vehicle_data.get("serviceStatus")
+        
+        # Объединяем все данные
+        return {
+            "parsed_data": parsed_data,
+            "vin": self.vin,
+            "model": self.model,
+            "vehicleNumber": self.vehicle_number,
+            "latitude": latitude,
+            "longitude": longitude,
+            "location_accuracy": _extract_location_accuracy(vehicle_data),
+            "update_time": update_time,
+            # Готовый datetime для сенсора времени обновления: считаем раз за опрос
+            "last_update_dt": _ms_to_datetime(update_time),
+            "service_status": service_status,
+            # "oil_qty": vehicle_data.get("oilQty"),  # не используется — убрано
+        }
+
+
+def _jittered_interval(seconds: float) -> timedelta:
+    """Return a jittered interval capped at MAX_UPDATE_INTERVAL.
+
+    Джиттер рассинхронизирует опрос нескольких экземпляров интеграции.
+    """
+    seconds *= random.uniform(*UPDATE_INTERVAL_JITTER)
+    return timedelta(seconds=min(seconds, MAX_UPDATE_INTERVAL))
+
+
+def _ms_to_datetime(timestamp) -> datetime | None:
+    """Convert a millisecond API timestamp to an aware UTC datetime."""
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc)
+    except (ValueError, TypeError, OverflowError, OSError):
+        return None
+
 
 def _extract_location_accuracy(vehicle_data: dict) -> int | None:
     """Extract location accuracy in meters from known API fields."""
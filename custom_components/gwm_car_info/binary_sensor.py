@@ -1,7 +1,7 @@
 """Binary sensor platform for GWM Car Info."""
 from __future__ import annotations
 
-from typing import Any
+import sys
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -62,29 +62,28 @@ async def async_setup_entry(
 class GWMBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
     """Base class for GWM binary sensors."""
 
+    _attr_has_entity_name = True
+    # Ключ значения в плоских данных координатора (см. coordinator.value)
+    _key: str
+    # Общие атрибуты не дублируем — локализованные есть в device_tracker
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.config_entry = config_entry
-        self._attr_has_entity_name = True
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.vin)},
-            name=f"GWM {self.coordinator.model}",
+        # DeviceInfo не меняется за время жизни записи — собираем один раз
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.vin)},
+            name=f"GWM {coordinator.model}",
             manufacturer="GWM",
-            model=self.coordinator.model,
+            model=coordinator.model,
             sw_version=VERSION,
         )
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Binary sensors do not expose shared attributes to avoid duplication.
-        Локализованные общие атрибуты доступны в device_tracker.
-        """
-        return {}
+    def is_on(self) -> bool | None:
+        """Return the state of the sensor."""
+        return self.coordinator.value(self._key)
 
     # timestamp formatting is centralized in utils.format_timestamp_local
 
@@ -93,21 +92,21 @@ class GWMBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
 class GWMDoorsLockedSensor(GWMBinarySensorBase):
     """Doors locked sensor."""
 
+    _attr_translation_key = "doors_unlocked"
+    # Диагностический сенсор, без device_class, показывает True когда двери открыты
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:car-door"
+    _key = "doors_locked"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_doors_unlocked"
-        self._attr_translation_key = "doors_unlocked"
-        # Диагностический сенсор, без device_class, показывает True когда двери открыты
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_icon = "mdi:car-door"
 
     @property
     def is_on(self) -> bool | None:
         """Return true if doors are unlocked (инверсия)."""
-        if not self.coordinator.data:
-            return None
-        locked = self.coordinator.data.get("parsed_data", {}).get("doors_locked")
+        locked = self.coordinator.value(self._key)
         if locked is None:
             return None
         return not locked
@@ -124,88 +123,67 @@ class GWMDoorsLockedSensor(GWMBinarySensorBase):
 class GWMDoorSensor(GWMBinarySensorBase):
     """Door sensor."""
 
+    _attr_device_class = BinarySensorDeviceClass.DOOR
+
     def __init__(self, coordinator, config_entry: ConfigEntry, door_type: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
-        self.door_type = door_type
+        # Ключ parsed_data собирается в рантайме — интернируем, как литералы
+        self._key = sys.intern(f"door_{door_type}")
         self._attr_unique_id = f"{coordinator.vin}_door_{door_type}"
         self._attr_translation_key = f"door_{door_type}"
-        self._attr_device_class = BinarySensorDeviceClass.DOOR
         
         if door_type == "trunk":
             self._attr_icon = "mdi:car-back"
         else:
             self._attr_icon = "mdi:car-door"
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if door is open."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get(f"door_{self.door_type}")
-
-
 class GWMHoodSensor(GWMBinarySensorBase):
     """Hood sensor."""
 
+    _attr_translation_key = "hood"
+    _attr_device_class = BinarySensorDeviceClass.DOOR
+    _attr_icon = "mdi:car-outline"
+    _key = "hood"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_hood"
-        self._attr_translation_key = "hood"
-        self._attr_device_class = BinarySensorDeviceClass.DOOR
-        self._attr_icon = "mdi:car-outline"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if hood is open."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get("hood")
-
 
 # Климат и комфорт
 class GWMAirConditionerSensor(GWMBinarySensorBase):
     """Air conditioner sensor."""
 
+    _attr_translation_key = "air_conditioner"
+    _attr_device_class = BinarySensorDeviceClass.RUNNING
+    _attr_icon = "mdi:air-conditioner"
+    _key = "air_conditioner"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_air_conditioner"
-        self._attr_translation_key = "air_conditioner"
-        self._attr_device_class = BinarySensorDeviceClass.RUNNING
-        self._attr_icon = "mdi:air-conditioner"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if air conditioner is on."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get("air_conditioner")
-
 
 class GWMFrontDefrosterSensor(GWMBinarySensorBase):
     """Front defroster sensor."""
 
+    _attr_translation_key = "front_defroster"
+    _attr_device_class = BinarySensorDeviceClass.HEAT
+    _attr_icon = "mdi:car-defrost-front"
+    _key = "front_defroster"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_front_defroster"
-        self._attr_translation_key = "front_defroster"
-        self._attr_device_class = BinarySensorDeviceClass.HEAT
-        self._attr_icon = "mdi:car-defrost-front"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if front defroster is on."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get("front_defroster")
-
 
 class GWMTireAlarmSensor(GWMBinarySensorBase):
     """Tire pressure or temperature alarm sensor."""
 
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
     def __init__(
         self,
         coordinator,
@@ -215,53 +193,31 @@ class GWMTireAlarmSensor(GWMBinarySensorBase):
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
-        self.alarm_type = alarm_type
-        self.position = position
+        self._key = sys.intern(f"tire_{alarm_type}_alarm_{position}")
         self._attr_unique_id = f"{coordinator.vin}_tire_{alarm_type}_alarm_{position}"
         self._attr_translation_key = f"tire_{alarm_type}_alarm_{position}"
-        self._attr_device_class = BinarySensorDeviceClass.PROBLEM
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_icon = (
             "mdi:car-tire-alert"
             if alarm_type == "pressure"
             else "mdi:thermometer-alert"
         )
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if tire alarm is active."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get(
-            f"tire_{self.alarm_type}_alarm_{self.position}"
-        )
-
-
 # Система
 class GWMGPSAuthorizedSensor(GWMBinarySensorBase):
     """GPS authorized sensor."""
 
+    _attr_translation_key = "gps_authorized"
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:map-marker-check"
+    _key = "gps_authorized"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_gps_authorized"
-        self._attr_translation_key = "gps_authorized"
-        self._attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_icon = "mdi:map-marker-check"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if GPS is authorized."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get("gps_authorized")
-
     @property
     def icon(self) -> str:
         """Return the icon."""
-        if not self.coordinator.data:
-            return "mdi:map-marker-off"
-        
-        authorized = self.coordinator.data.get("parsed_data", {}).get("gps_authorized")
+        authorized = self.coordinator.value(self._key)
         return "mdi:map-marker-check" if authorized else "mdi:map-marker-off"
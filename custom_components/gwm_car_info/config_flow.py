@@ -1,6 +1,7 @@
 """Config flow for GWM Car Info integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from typing import Any
@@ -14,9 +15,13 @@ from homeassistant.exceptions import HomeAssistantError
 
 from .const import DOMAIN
 from .gwm_api import GWMCarInfoClient, _mask_email
+from .utils import async_load_device_id
 
 _LOGGER = logging.getLogger(__name__)
 
+# Простая e-mail валидация (не строгая, но защищает от явных опечаток)
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 # Схема данных для формы настройки
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -26,11 +31,25 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+def _build_label(vehicle: dict[str, Any]) -> str:
+    """Build a vehicle label: "Модель (Цвет) - ГосНомер [VIN]"."""
+    color = vehicle.get("color")
+    plate = vehicle.get("vehicleNumber")
+    return "".join((
+        vehicle.get("vtype") or "Модель неизвестна",
+        f" ({color})" if color else "",
+        f" - {plate}" if plate else "",
+        f" [{vehicle['vin']}]",
+    ))
+
+
 async def _async_create_client(hass: HomeAssistant) -> GWMCarInfoClient:
     """Create a GWM API client with Home Assistant storage-backed device ID."""
     client = GWMCarInfoClient()
-    client.device_id_file = hass.config.path(".storage/gwm_car_info_device_id.txt")
-    client.device_id = await hass.async_add_executor_job(client.load_device_id)
+    client.device_id, _ = await asyncio.gather(
+        async_load_device_id(hass),
+        hass.async_add_executor_job(client.setup_ssl_certificates),
+    )
     return client
 
 
@@ -44,8 +63,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     data["email"] = data["email"].strip()
     if not data["password"]:
         raise InvalidAuth("Пароль не должен быть пустым")
-    # Простая e-mail валидация (не строгая, но защищает от явных опечаток)
-    if not re.match(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", data["email"]):
+    if not _EMAIL_RE.match(data["email"]):
         raise InvalidAuth("Некорректный формат email")
 
     # Создаем клиент GWM API с тем же device_id, что используется после настройки.
@@ -54,9 +72,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     try:
         # Проверяем логин
         try:
-            login_success = await hass.async_add_executor_job(
-                client.login, data["email"], data["password"]
-            )
+            login_success = await client.login(data["email"], data["password"])
             
             if not login_success:
                 _LOGGER.warning(
@@ -75,14 +91,13 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         
         # Всегда получаем список автомобилей и предлагаем выбор (даже если авто одно)
         try:
-            vehicles_list = await hass.async_add_executor_job(
-                client.get_vehicles_list
-            )
+            vehicles_list = await client.get_vehicles_list()
             if not vehicles_list or not vehicles_list.get("data"):
                 raise CannotConnect("Не найдено привязанных автомобилей в аккаунте.")
             vehicles = vehicles_list["data"]
-            # Возвращаем на следующий шаг выбора
+            # Возвращаем на следующий шаг выбора вместе с авторизованным клиентом
             return {
+                "client": client,
                 "vehicles": vehicles,
                 "email": data["email"],
                 "password": data["password"],
@@ -100,6 +115,9 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     except Exception as exc:
         _LOGGER.exception("Unexpected exception during validation")
         raise CannotConnect(f"Неожиданная ошибка: {exc}") from exc
+    finally:
+        # Токен остается в клиенте; сессия пересоздастся при следующем запросе
+        await client.async_close()
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -113,6 +131,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._email: str | None = None
         self._password: str | None = None
         self._label_to_vin: dict[str, str] = {}
+        self._client: GWMCarInfoClient | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -126,10 +145,22 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 
                 # Если вернулся список автомобилей, переходим к выбору
                 if "vehicles" in info:
-                    self._vehicles = info["vehicles"]
+                    # Уже настроенные автомобили в список выбора не попадают
+                    configured_vins = {
+                        entry.unique_id for entry in self._async_current_entries()
+                    }
+                    self._vehicles = [
+                        vehicle
+                        for vehicle in info["vehicles"]
+                        if vehicle.get("vin") not in configured_vins
+                    ]
+                    if not self._vehicles:
+                        return self.async_abort(reason="already_configured")
+                    self._label_to_vin = {}
                     # Сохраняем учетные данные для следующего шага
                     self._email = info.get("email")
                     self._password = info.get("password")
+                    self._client = info.get("client")
                     return await self.async_step_vehicle_select({
                         # Переходим к форме выбора
                     })
@@ -176,38 +207,43 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         
         if user_input is not None and ("vin" in user_input or "vehicle" in user_input):
+            # Пользователь выбирает метку; маппим обратно к VIN
+            selected_label = user_input.get("vin") or user_input.get("vehicle")
+            selected_vin = self._label_to_vin.get(selected_label, selected_label)
+
+            # Проверяем что такого VIN еще нет — до логина и запроса данных
+            await self.async_set_unique_id(selected_vin)
+            self._abort_if_unique_id_configured()
+
             try:
-                # Пользователь выбирает метку; маппим обратно к VIN
-                selected_label = user_input.get("vin") or user_input.get("vehicle")
-                selected_vin = self._label_to_vin.get(selected_label, selected_label)
-                
-                # Создаем клиент и получаем данные выбранного автомобиля
-                client = await _async_create_client(self.hass)
-                
-                # Логинимся
-                if not self._email or not self._password:
-                    raise CannotConnect("Учетные данные потеряны в контексте конфигурации")
-                login_success = await self.hass.async_add_executor_job(
-                    client.login, self._email, self._password
-                )
-                
-                if not login_success:
-                    _LOGGER.warning(
-                        "Login failed during vehicle selection for user %s: "
-                        "status=%s code=%s description=%s",
-                        _mask_email(self._email),
-                        client.last_http_status,
-                        client.last_error_code,
-                        client.last_error_description,
+                # Используем клиент, авторизованный на шаге user; иначе логинимся заново
+                client = self._client
+                if client is not None and client.access_token:
+                    vehicle_data = await client.get_vehicle_by_vin(selected_vin)
+                else:
+                    client = await _async_create_client(self.hass)
+                    
+                    if not self._email or not self._password:
+                        raise CannotConnect("Учетные данные потеряны в контексте конфигурации")
+                    vehicle_data = await client.login_and_get_vehicle(
+                        self._email, self._password, selected_vin
                     )
-                    raise InvalidAuth("Не удалось войти в систему")
-                
-                # Получаем данные автомобиля
-                vehicle_data = await self.hass.async_add_executor_job(
-                    client.get_vehicle_by_vin, selected_vin
-                )
+                    
+                    if not client.access_token:
+                        _LOGGER.warning(
+                            "Login failed during vehicle selection for user %s: "
+                            "status=%s code=%s description=%s",
+                            _mask_email(self._email),
+                            client.last_http_status,
+                            client.last_error_code,
+                            client.last_error_description,
+                        )
+                        raise InvalidAuth("Не удалось войти в систему")
+                    self._client = client
                 
                 if not vehicle_data:
+                    # Токен мог протухнуть — при повторной попытке залогинимся заново
+                    self._client = None
                     raise CannotConnect("Не удалось получить данные выбранного автомобиля")
                 
                 # Определяем модель и госномер из списка автомобилей
@@ -215,10 +251,6 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 model = (selected_vehicle or {}).get("vtype") or "Неизвестная модель"
                 plate = (selected_vehicle or {}).get("vehicleNumber")
                 
-                # Проверяем что такого VIN еще нет
-                await self.async_set_unique_id(selected_vin)
-                self._abort_if_unique_id_configured()
-                
                 return self.async_create_entry(
                     title=f"GWM {model}",
                     data={
@@ -236,23 +268,17 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception in vehicle selection")
                 errors["base"] = "unknown"
+            finally:
+                if client is not None:
+                    await client.async_close()
         
-        # Создаем схему для выбора автомобиля
-        # Формируем отображаемые ярлыки: "Модель (Цвет) - ГосНомер [VIN]"
-        self._label_to_vin = {}
-        for vehicle in self._vehicles:
-            vin = vehicle.get("vin", "") or ""
-            model = vehicle.get("vtype", "Модель неизвестна")
-            color = vehicle.get("color", "")
-            plate = vehicle.get("vehicleNumber", "")
-            label = model
-            if color:
-                label += f" ({color})"
-            if plate:
-                label += f" - {plate}"
-            if vin:
-                label_full = f"{label} [{vin}]"
-                self._label_to_vin[label_full] = vin
+        # Создаем схему для выбора автомобиля; ярлыки считаем один раз за шаг
+        if not self._label_to_vin:
+            self._label_to_vin = {
+                _build_label(vehicle): vehicle["vin"]
+                for vehicle in self._vehicles
+                if vehicle.get("vin")
+            }
 
         schema = vol.Schema({vol.Required("vin"): vol.In(list(self._label_to_vin.keys()))})
         
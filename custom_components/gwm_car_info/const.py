@@ -6,6 +6,27 @@ VERSION = "1.0.5"
 # Интервал обновления данных (в секундах)
 UPDATE_INTERVAL = 30  # 30 секунд
 
+# Адаптивный опрос: при стабильном состоянии интервал удваивается до MAX_UPDATE_INTERVAL,
+# при изменении данных сбрасывается к UPDATE_INTERVAL (с небольшим джиттером)
+MAX_UPDATE_INTERVAL = 600  # 10 минут
+STABLE_POLLS_BEFORE_BACKOFF = 3
+UPDATE_INTERVAL_JITTER = (0.8, 1.2)
+
+# Кэш последнего ответа API в .storage (быстрый старт без ожидания сети)
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10  # секунд; меньше UPDATE_INTERVAL, чтобы опрос не откладывал запись
+
+# device_id приложения общий для всех записей; txt-файл — старый формат хранения
+DEVICE_ID_STORAGE_KEY = f"{DOMAIN}.device_id"
+LEGACY_DEVICE_ID_FILE = ".storage/gwm_car_info_device_id.txt"
+
+# Сервисы
+SERVICE_REFRESH = "refresh"
+
+# Канонические строковые токены состояний (переводятся через translations)
+ENGINE_STATE_MAP: dict[int, str] = {0: "off", 1: "starting", 2: "running"}
+SERVICE_STATUS_MAP: dict[int, str] = {1: "active", 0: "inactive"}
+
 # Атрибуты, используемые в устройстве/трекере
 ATTR_VIN = "vin"
 ATTR_MODEL = "model"
@@ -13,6 +13,8 @@ from .utils import format_timestamp_local
 
 from .const import (
     DOMAIN,
+    ENGINE_STATE_MAP,
+    SERVICE_STATUS_MAP,
     VERSION,
     ATTR_VIN,
     ATTR_MODEL,
@@ -48,17 +50,18 @@ class GWMCarTracker(CoordinatorEntity, TrackerEntity):
         self._attr_unique_id = f"{coordinator.vin}_location_tracker"
         self._attr_translation_key = "vehicle_location"
         self._attr_icon = "mdi:car"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.vin)},
-            name=f"GWM {self.coordinator.model}",
+        # DeviceInfo не меняется за время жизни записи — собираем один раз
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.vin)},
+            name=f"GWM {coordinator.model}",
             manufacturer="GWM",
-            model=self.coordinator.model,
+            model=coordinator.model,
             sw_version=VERSION,
         )
+        # Атрибуты читаются намного чаще, чем обновляется координатор:
+        # пересобираем их только при замене coordinator.data (как value())
+        self._cached_attrs: dict[str, Any] = {}
+        self._attrs_source: dict | None = None
 
     @property
     def source_type(self) -> SourceType:
@@ -68,31 +71,32 @@ class GWMCarTracker(CoordinatorEntity, TrackerEntity):
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the device."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("latitude")
+        return self.coordinator.value("latitude")
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the device."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("longitude")
+        return self.coordinator.value("longitude")
 
     @property
     def location_accuracy(self) -> int:
         """Return the location accuracy of the device."""
-        if not self.coordinator.data:
-            return 50
-        return self.coordinator.data.get("location_accuracy") or 50
+        return self.coordinator.value("location_accuracy") or 50
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
+        """Return extra state attributes, rebuilt only for new coordinator data."""
+        data = self.coordinator.data
+        if data is not self._attrs_source:
+            self._attrs_source = data
+            self._cached_attrs = self._build_state_attributes(data)
+        return self._cached_attrs
+
+    def _build_state_attributes(self, data: dict | None) -> dict[str, Any]:
+        """Build extra state attributes from a coordinator payload."""
+        if not data:
             return {}
         
-        data = self.coordinator.data
         attrs = {
             ATTR_VIN: data.get("vin"),
             ATTR_MODEL: data.get("model"),
@@ -105,7 +109,7 @@ class GWMCarTracker(CoordinatorEntity, TrackerEntity):
         }
         
         # Добавляем данные о состоянии автомобиля
-        parsed_data = data.get("parsed_data", {})
+        parsed_data = data.get("parsed_data")
         if parsed_data:
             attrs.update({
                 "mileage": parsed_data.get("mileage"),
@@ -114,9 +118,8 @@ class GWMCarTracker(CoordinatorEntity, TrackerEntity):
                 # Канонические строковые токены без хардкода RU
                 "engine_state": self._get_engine_state_text(parsed_data.get("engine_state")),
                 "doors_locked": "locked" if parsed_data.get("doors_locked") else "unlocked",
-                "service_status": (
-                    "active" if data.get("service_status") == 1
-                    else ("inactive" if data.get("service_status") == 0 else "unknown")
+                "service_status": SERVICE_STATUS_MAP.get(
+                    data.get("service_status"), "unknown"
                 ),
             })
         
@@ -124,23 +127,18 @@ class GWMCarTracker(CoordinatorEntity, TrackerEntity):
 
     def _get_engine_state_text(self, state) -> str:
         """Get engine state text."""
-        if state == 0:
-            return "off"
-        elif state == 1:
-            return "starting"
-        elif state == 2:
-            return "running"
-        else:
-            return f"unknown_{state}"
+        return ENGINE_STATE_MAP.get(state) or f"unknown_{state}"
 
     # timestamp formatting moved to utils.format_timestamp_local
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
+        # Один снимок данных: без повторных чтений coordinator.data между проверками
+        data = self.coordinator.data
+        return bool(
             self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and self.latitude is not None
-            and self.longitude is not None
+            and data
+            and data.get("latitude") is not None
+            and data.get("longitude") is not None
         )
@@ -2,19 +2,136 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import os
-import re
+import ssl
 import time
 import uuid
-from typing import Dict, Optional
-from urllib.parse import parse_qs, quote, urlparse
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+from urllib.parse import quote_from_bytes, urlparse
 
-import requests
+import aiohttp
+import certifi
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+# Мобильные заголовки: без них GWM CloudWAF блокирует запросы (418)
+_SESSION_HEADERS = {
+    "User-Agent": "okhttp/4.12.0",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
+    "Connection": "Keep-Alive",
+}
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Пробельные символы, удаляемые из строки подписи (как \s в Java: [ \t\n\x0B\f\r])
+_WS_TRANS = str.maketrans('', '', ' \t\r\n\v\f')
+
+# Статические заголовки приложения; deviceId/iccid добавляются в клиенте
+_APP_HEADERS = MappingProxyType({
+    "ip": "0.0.0.0",
+    "rs": "2",
+    "appId": "1",
+    "brand": "1",
+    "terminal": "GW_APP_Haval",
+    "enterpriseId": "gwm",
+    "systemType": "1",
+    "cVer": "2.0.1",
+    "timeZone": "Europe/Moscow",
+    "channel": "APP",
+    "language": "ru_RU",
+    "regionCode": "RU",
+    "country": "RU",
+    "communityBrand": "",
+    "Content-Type": "application/json",
+})
+
+# Клиентский сертификат лежит в папке интеграции
+_CERTIFICATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'certificates')
+_CERT_FILE = os.path.join(_CERTIFICATES_DIR, 'gwm_general.pem')
+_KEY_FILE = os.path.join(_CERTIFICATES_DIR, 'gwm_general.key')
+
+# Загруженный SSL контекст: повторные клиенты (config flow, перезагрузка
+# записи) не перечитывают PEM и не проверяют файлы заново
+_SSL_CONTEXT: ssl.SSLContext | None = None
+
+
+def _ident(value):
+    return value
+
+
+def _is_one(value) -> bool:
+    return value == 1
+
+
+def _is_zero(value) -> bool:
+    return value == 0
+
+
+def _sunroof_position(value):
+    # 3 = закрыт, иначе % открытия
+    return 0 if value == 3 else value
+
+
+# Код элемента telemetry -> (ключ в parsed_data, преобразование значения)
+_CODE_MAP = {
+    # Основные параметры
+    '2013005': ('battery_12v_level', _ident),    # Уровень заряда 12V батареи
+    '2017002': ('fuel_volume', _ident),          # Объем топлива
+    '2103010': ('mileage', _ident),              # Общий пробег
+    '2011007': ('fuel_range', _ident),           # Запас хода на топливе
+    
+    # Шины
+    '2101001': ('tire_pressure_fl', _ident),     # Передняя левая
+    '2101002': ('tire_pressure_fr', _ident),     # Передняя правая
+    '2101003': ('tire_pressure_rl', _ident),     # Задняя левая
+    '2101004': ('tire_pressure_rr', _ident),     # Задняя правая
+    '2101005': ('tire_temp_fl', _ident),         # Температура передней левой
+    '2101006': ('tire_temp_fr', _ident),         # Температура передней правой
+    '2101007': ('tire_temp_rl', _ident),         # Температура задней левой
+    '2101008': ('tire_temp_rr', _ident),         # Температура задней правой
+    '2102001': ('tire_pressure_alarm_fl', _is_one),  # Авария давления передней левой
+    '2102002': ('tire_pressure_alarm_fr', _is_one),  # Авария давления передней правой
+    '2102003': ('tire_pressure_alarm_rl', _is_one),  # Авария давления задней левой
+    '2102004': ('tire_pressure_alarm_rr', _is_one),  # Авария давления задней правой
+    '2102007': ('tire_temp_alarm_fl', _is_one),  # Авария температуры передней левой
+    '2102008': ('tire_temp_alarm_fr', _is_one),  # Авария температуры передней правой
+    '2102009': ('tire_temp_alarm_rl', _is_one),  # Авария температуры задней левой
+    '2102010': ('tire_temp_alarm_rr', _is_one),  # Авария температуры задней правой
+    
+    # Состояние автомобиля
+    '2016001': ('engine_state', _ident),         # Состояние двигателя
+    # По факту на ТANK 300: 0 = заблокированы, 1 = разблокированы
+    '2208001': ('doors_locked', _is_zero),       # Замки дверей
+    '2206001': ('door_trunk', _is_one),          # Багажник (1=открыт, 0=закрыт)
+    '2206002': ('door_front_left', _is_one),     # Передняя левая дверь
+    '2206003': ('door_rear_left', _is_one),      # Задняя левая дверь
+    '2206004': ('door_front_right', _is_one),    # Передняя правая дверь
+    '2206005': ('door_rear_right', _is_one),     # Задняя правая дверь
+    '2212001': ('hood', _is_one),                # Капот
+    
+    # Климат и комфорт
+    '2202001': ('air_conditioner', _is_one),     # Кондиционер
+    '2222001': ('front_defroster', _is_one),     # Обогрев/обдув лобового стекла
+    '2210005': ('sunroof_position', _sunroof_position),  # Позиция люка
+    # seat_heat — не используется в интеграции
+    
+    # Система
+    '2310001': ('gps_authorized', _is_one),      # Авторизация GPS
+    '4105008': ('signal_strength', _ident),      # Мощность сигнала сети
+}
+
+# Ключи parsed_data в порядке _CODE_MAP; пустой результат — dict.fromkeys(_INFO_KEYS)
+_INFO_KEYS = tuple(key for key, _ in _CODE_MAP.values())
+
+
+def _path_string(path: str) -> str:
+    """Normalize a URL path for signing: drop empty segments."""
+    return '/' + '/'.join(seg for seg in path.split('/') if seg)
+
 
 def _mask_email(email: str) -> str:
     """Mask email for logging (jo***@example.com)."""
@@ -31,15 +148,10 @@ class GWMCarInfoClient:
 
     def __init__(self):
         """Initialize the GWM client."""
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "okhttp/4.12.0",
-                "Accept": "application/json",
-                "Accept-Encoding": "gzip",
-                "Connection": "Keep-Alive",
-            }
-        )
+        # aiohttp сессия создается лениво в event loop (см. _get_session),
+        # SSL контекст с клиентским сертификатом — в setup_ssl_certificates
+        self._session: aiohttp.ClientSession | None = None
+        self._ssl_context: ssl.SSLContext | None = None
         self.access_token = None
         self.user_info = None
         self.last_error_code = None
@@ -52,173 +164,151 @@ class GWMCarInfoClient:
         self.app_sec = "e4e478c00f570e76a8993653a7b81d57"
         self.auth_prefix = "gwm"
         
-        # Пути к файлам в папке интеграции
-        self.component_dir = os.path.dirname(os.path.abspath(__file__))
-        self.certificates_dir = os.path.join(self.component_dir, 'certificates')
-        # По умолчанию device_id.txt в папке компонента, НО в интеграции путь
-        # переопределяется на hass.config.path('.storage/...') в __init__.py
-        # чтобы избежать блокирующих операций и обеспечить персистентность.
-        self.device_id_file = os.path.join(self.component_dir, 'device_id.txt')
+        # Инварианты подписи: имена заголовков и шаблон auth-строки считаем один раз
+        prefix = self.auth_prefix
+        self._sign_header_keys = (
+            f"{prefix}-auth-appkey",
+            f"{prefix}-auth-timestamp",
+            f"{prefix}-auth-sign",
+            f"{prefix}-auth-nonce",
+        )
+        self._auth_string_fmt = (
+            f"{prefix}-auth-appkey:{self.app_key}"
+            f"{prefix}-auth-nonce:{{nonce}}"
+            f"{prefix}-auth-timestamp:{{timestamp}}"
+        ).format
         
-        # Device ID загружается позже из async_setup_entry через executor
-        self.device_id = None
+        # Эндпоинты постоянны: URL и path string для подписи считаем один раз
+        self._endpoints = {}
+        for name, path in (
+            ("login", "app-api/api/v1.0/userAuth/loginAccount"),
+            ("last_status", "app-api/api/v1.0/vehicle/getLastStatus"),
+            ("vehicles", "app-api/api/v1.0/vehicle/acquireVehicles"),
+        ):
+            url = f"{self.base_url}{path}"
+            self._endpoints[name] = (url, _path_string(urlparse(url).path))
         
-        # RSA не используется (isEncrypt: False)
+        # Device ID задается интеграцией из .storage (utils.async_load_device_id)
+        self.device_id = None
 
-    def load_device_id(self) -> str:
-        """Load device ID from file or generate new one."""
-        try:
-            if os.path.exists(self.device_id_file):
-                # Используем sync файловые операции только при инициализации
-                with open(self.device_id_file, 'r') as f:
-                    device_id = f.read().strip()
-                    if device_id:
-                        _LOGGER.debug("Loaded existing device_id: %s", device_id[:8] + "...")
-                        return device_id
-        except (OSError, PermissionError) as exc:
-            _LOGGER.warning("Failed to load device_id: %s", exc)
-        
-        # Генерируем новый device_id
-        device_id = str(uuid.uuid4()).replace('-', '')
-        self.save_device_id(device_id)
-        _LOGGER.info("Generated new device_id: %s", device_id[:8] + "...")
-        return device_id
-    
-    def save_device_id(self, device_id: str):
-        """Save device ID to file."""
-        try:
-            os.makedirs(os.path.dirname(self.device_id_file), exist_ok=True)
-            with open(self.device_id_file, 'w') as f:
-                f.write(device_id)
-            _LOGGER.debug("Saved device_id to file")
-        except (OSError, PermissionError) as exc:
-            _LOGGER.warning("Failed to save device_id: %s", exc)
+    @property
+    def device_id(self) -> str | None:
+        """Return the device ID sent with every request."""
+        return self._device_id
+
+    @device_id.setter
+    def device_id(self, device_id: str | None) -> None:
+        """Set the device ID and rebuild the cached base headers."""
+        self._device_id = device_id
+        self._base_headers = MappingProxyType({
+            **_APP_HEADERS,
+            "deviceId": device_id,
+            "iccid": device_id,
+        })
 
     def setup_ssl_certificates(self) -> bool:
-        """Настройка SSL сертификатов."""
+        """Настройка SSL сертификатов.
+
+        Блокирующий вызов (чтение PEM) — выполнять в executor до первого запроса.
+        """
+        global _SSL_CONTEXT
+        if _SSL_CONTEXT is not None:
+            self._ssl_context = _SSL_CONTEXT
+            return True
+        
         try:
-            # Пути к сертификатам
-            cert_file = os.path.join(self.certificates_dir, 'gwm_general.pem')
-            key_file = os.path.join(self.certificates_dir, 'gwm_general.key')
-            
             # Проверяем что файлы существуют
-            if not os.path.exists(cert_file) or not os.path.exists(key_file):
+            if not os.path.isfile(_CERT_FILE) or not os.path.isfile(_KEY_FILE):
                 _LOGGER.warning("SSL сертификаты не найдены")
                 return False
             
-            # Устанавливаем сертификаты
-            self.session.cert = (cert_file, key_file)
+            # Собираем SSL контекст один раз: он переиспользуется всеми соединениями
+            ssl_context = ssl.create_default_context(cafile=certifi.where())
+            ssl_context.load_cert_chain(_CERT_FILE, _KEY_FILE)
+            self._ssl_context = ssl_context
+            _SSL_CONTEXT = ssl_context
             _LOGGER.info("SSL сертификаты найдены")
+            # SHA256 для подписи идет через OpenSSL (аппаратный SHA-NI с 1.1.1+)
+            _LOGGER.debug(
+                "OpenSSL: %s, hashlib: %s",
+                ssl.OPENSSL_VERSION,
+                ", ".join(sorted(hashlib.algorithms_guaranteed)),
+            )
             return True
             
         except OSError as e:
             _LOGGER.warning("SSL сертификаты не найдены: %s", e)
             return False
 
-    def generate_nonce(self) -> str:
-        """Генерируем nonce."""
-        import random
-        
-        nano_time_str = str(int(time.time_ns()))
-        md5_hash = hashlib.md5(nano_time_str.encode()).hexdigest()
-        
-        if len(md5_hash) < 16:
-            random_num = str(abs(random.randint(0, 9223372036854775807)))
-            md5_hash += random_num
-        
-        return md5_hash[:16]
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the keep-alive aiohttp session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                ssl=self._ssl_context if self._ssl_context is not None else True,
+                limit=10,
+                keepalive_timeout=75,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=_SESSION_HEADERS,
+                timeout=_REQUEST_TIMEOUT,
+            )
+        return self._session
 
-    def url_encode(self, text: str) -> str:
-        """URL кодирование."""
-        return quote(text, safe='')
+    async def async_close(self) -> None:
+        """Close the HTTP session; it is recreated on the next request."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
-    def sha256_hash(self, text: str) -> str:
-        """Generate SHA256 hash."""
-        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    def generate_nonce(self) -> str:
+        """Генерируем nonce."""
+        # 16 hex-символов напрямую из os.urandom, без MD5 от наносекунд
+        return os.urandom(8).hex()
 
-    def build_path_string(self, url_obj) -> str:
-        """Строим path string."""
-        path_segments = [seg for seg in url_obj.path.split('/') if seg]
-        return '/' + '/'.join(path_segments)
-    
-    def build_query_string(self, url_obj) -> str:
-        """Строим query string."""
-        if not url_obj.query:
-            return ""
-        
-        params = parse_qs(url_obj.query)
-        sorted_params = []
-        
-        for key in sorted(params.keys()):
-            for value in params[key]:
-                sorted_params.append(f"{key.lower()}={value}")
-        
-        return "&".join(sorted_params)
-
-    def build_body_string(self, request_method: str, url_obj, body: str = None) -> str:
-        """Строим body string."""
-        if request_method == "GET":
-            return self.build_query_string(url_obj)
-        elif request_method == "POST" and body:
-            with_prefix = f"json={body}"
-            return re.sub(r'\s*|\t|\r|\n', '', with_prefix)
-        return ""
-
-    def generate_signature_headers(self, method: str, url: str, body: str = None, params: Dict[str, object] = None) -> Dict[str, str]:
-        """Generate signature headers."""
-        url_obj = urlparse(url)
-        current_time = int(time.time() * 1000)
+    def _signature_headers(
+        self,
+        method: str,
+        path_string: str,
+        body: Optional[str] = None,
+        params: Optional[Mapping[str, object]] = None,
+    ) -> Dict[str, str]:
+        """Generate signature headers for an endpoint's signing path string."""
+        timestamp = str(int(time.time() * 1000))
         nonce = self.generate_nonce()
         
-        auth_string = (f"{self.auth_prefix}-auth-appkey:{self.app_key}"
-                      f"{self.auth_prefix}-auth-nonce:{nonce}"
-                      f"{self.auth_prefix}-auth-timestamp:{current_time}")
-        
-        path_string = self.build_path_string(url_obj)
+        auth_string = self._auth_string_fmt(nonce=nonce, timestamp=timestamp)
         
         if method == "GET" and params:
-            sorted_params = []
-            for key in sorted(params.keys()):
-                value = params[key]
-                sorted_params.append(f"{key.lower()}={value}")
-            body_string = "&".join(sorted_params)
+            # Свои params со скалярными значениями: один проход
+            body_string = "&".join(
+                f"{key.lower()}={value}" for key, value in sorted(params.items())
+            )
+        elif method == "POST" and body:
+            # Пробелы удаляются из всей строки подписи ниже
+            body_string = f"json={body}"
         else:
-            body_string = self.build_body_string(method, url_obj, body)
+            body_string = ""
         
         signature_string = f"{method}{path_string}{auth_string}{body_string}{self.app_sec}"
-        clean_signature_string = re.sub(r'\s*|\t|\r|\n', '', signature_string)
-        encoded_signature_string = self.url_encode(clean_signature_string)
-        signature = self.sha256_hash(encoded_signature_string)
+        clean_signature_string = signature_string.translate(_WS_TRANS)
+        # Одно кодирование: percent-encoding сразу из байт, результат ASCII
+        encoded_signature = quote_from_bytes(
+            clean_signature_string.encode('utf-8', 'surrogatepass'), safe=b''
+        ).encode('ascii')
+        signature = hashlib.sha256(encoded_signature).hexdigest()
         
+        appkey_key, timestamp_key, sign_key, nonce_key = self._sign_header_keys
         return {
-            f"{self.auth_prefix}-auth-appkey": self.app_key,
-            f"{self.auth_prefix}-auth-timestamp": str(current_time),
-            f"{self.auth_prefix}-auth-sign": signature,
-            f"{self.auth_prefix}-auth-nonce": nonce,
+            appkey_key: self.app_key,
+            timestamp_key: timestamp,
+            sign_key: signature,
+            nonce_key: nonce,
         }
 
-    def get_additional_headers(self) -> Dict[str, str]:
-        """Дополнительные заголовки."""
-        
-        headers = {
-            "ip": "0.0.0.0",
-            "rs": "2", 
-            "appId": "1",
-            "brand": "1",
-            "terminal": "GW_APP_Haval",
-            "enterpriseId": "gwm",
-            "systemType": "1",
-            "cVer": "2.0.1",
-            "timeZone": "Europe/Moscow",
-            "channel": "APP",
-            "language": "ru_RU",
-            "regionCode": "RU", 
-            "country": "RU",
-            "communityBrand": "",
-            "deviceId": self.device_id,
-            "iccid": self.device_id,
-            "Content-Type": "application/json"
-        }
+    def _request_headers(self, signature_headers: Dict[str, str]) -> Dict[str, str]:
+        """Merge signature headers with the cached base headers and token."""
+        headers = {**signature_headers, **self._base_headers}
         
         # Добавляем токен авторизации если есть
         if self.access_token:
@@ -226,8 +316,6 @@ class GWMCarInfoClient:
         
         return headers
 
-    # rsa_encrypt_password удален (isEncrypt: False)
-
     def clear_last_error(self) -> None:
         """Clear details from the previous failed API call."""
         self.last_error_code = None
@@ -245,17 +333,18 @@ class GWMCarInfoClient:
         self.last_error_description = str(description) if description is not None else None
         self.last_http_status = http_status
 
-    def login(self, email: str, password: str) -> bool:
+    async def login(self, email: str, password: str) -> bool:
         """Login to GWM account."""
         _LOGGER.info("Attempting login for user: %s", _mask_email(email))
         self.clear_last_error()
         
-        # Настраиваем SSL сертификаты перед запросами
-        ssl_ok = self.setup_ssl_certificates()
-        if not ssl_ok:
-            _LOGGER.warning("SSL certificates not found, trying without them (may fail)")
-        else:
-            _LOGGER.info("SSL certificates loaded successfully")
+        # SSL сертификаты загружаются заранее через setup_ssl_certificates
+        if self._ssl_context is None:
+            _LOGGER.warning("SSL certificates not loaded, trying without them (may fail)")
+        
+        # Без сохраненного device_id логинимся с разовым, чтобы он не был пустым
+        if not self.device_id:
+            self.device_id = uuid.uuid4().hex
         
         login_data = {
             "account": email,
@@ -265,7 +354,7 @@ class GWMCarInfoClient:
             "msgType": None,
             "model": "Android",
             "type": 1,
-            "deviceId": self.device_id or self.device_id_file,  # гарантируем не пустое
+            "deviceId": self.device_id,
             "appType": 0,
             "pushToken": "",
             "country": "RU",
@@ -273,39 +362,44 @@ class GWMCarInfoClient:
             "isEncrypt": False
         }
         
-        url = f"{self.base_url}app-api/api/v1.0/userAuth/loginAccount"
-        body = json.dumps(login_data, separators=(',', ':'), ensure_ascii=False)
+        url, path_string = self._endpoints["login"]
+        # orjson: компактный JSON без экранирования не-ASCII, порядок ключей сохраняется
+        # Подписываем ровно те байты, которые отправляем
+        body_bytes = json_bytes(login_data)
         
         try:
-            signature_headers = self.generate_signature_headers("POST", url, body)
-            additional_headers = self.get_additional_headers()
-            headers = {**signature_headers, **additional_headers}
+            headers = self._request_headers(
+                self._signature_headers(
+                    "POST", path_string, body_bytes.decode("utf-8")
+                )
+            )
             
             _LOGGER.debug("Making login request to: %s", url)
-            response = self.session.post(
+            async with self._get_session().post(
                 url,
                 headers=headers,
-                data=body.encode("utf-8"),
-                timeout=30,
-            )
+                data=body_bytes,
+            ) as response:
+                status = response.status
+                content = await response.read()
             
-            _LOGGER.debug("Login response status: %s", response.status_code)
+            _LOGGER.debug("Login response status: %s", status)
             
-            if response.status_code != 200:
-                response_text = response.text[:500] if response.text else ""
+            if status != 200:
+                response_text = content[:500].decode("utf-8", errors="replace")
                 self.set_last_error(
                     code="http_error",
                     description=response_text or "Empty response body",
-                    http_status=response.status_code,
+                    http_status=status,
                 )
                 _LOGGER.error(
                     "HTTP error during login: status=%s body=%s",
-                    response.status_code,
+                    status,
                     response_text,
                 )
                 return False
             
-            result = response.json() if response.text else {}
+            result = json_loads(content) if content else {}
             _LOGGER.debug("Login response: %s", result)
             
             if result.get("code") in ["0", "000000"]:
@@ -320,7 +414,7 @@ class GWMCarInfoClient:
                 self.set_last_error(
                     code=error_code,
                     description=error_desc,
-                    http_status=response.status_code,
+                    http_status=status,
                 )
                 _LOGGER.warning(
                     "Login failed for user %s: %s (%s)",
@@ -330,242 +424,128 @@ class GWMCarInfoClient:
                 )
                 return False
             
-        except requests.exceptions.SSLError as ssl_err:
+        except aiohttp.ClientSSLError as ssl_err:
             self.set_last_error(code="ssl_error", description=ssl_err)
             _LOGGER.error("SSL error during login: %s", ssl_err)
             return False
-        except requests.exceptions.ConnectionError as conn_err:
-            self.set_last_error(code="connection_error", description=conn_err)
-            _LOGGER.error("Connection error during login: %s", conn_err)
-            return False
-        except requests.exceptions.Timeout as timeout_err:
+        except TimeoutError as timeout_err:
             self.set_last_error(code="timeout", description=timeout_err)
             _LOGGER.error("Timeout error during login: %s", timeout_err)
             return False
-        except (requests.exceptions.RequestException, ValueError) as exc:
+        except aiohttp.ClientConnectionError as conn_err:
+            self.set_last_error(code="connection_error", description=conn_err)
+            _LOGGER.error("Connection error during login: %s", conn_err)
+            return False
+        except (aiohttp.ClientError, ValueError) as exc:
             self.set_last_error(code="unexpected_error", description=exc)
             _LOGGER.exception("Unexpected error during login: %s", exc)
             return False
 
-    def get_vehicle_by_vin(self, vin: str) -> Optional[Dict[str, object]]:
+    async def get_vehicle_by_vin(self, vin: str) -> Optional[Dict[str, object]]:
         """Get vehicle information by VIN."""
         if not self.access_token:
             return None
         
-        url = f"{self.base_url}app-api/api/v1.0/vehicle/getLastStatus"
+        url, path_string = self._endpoints["last_status"]
         params = {"vin": vin}
         
-        signature_headers = self.generate_signature_headers("GET", url, None, params)
-        additional_headers = self.get_additional_headers()
-        headers = {**signature_headers, **additional_headers}
+        headers = self._request_headers(
+            self._signature_headers("GET", path_string, None, params)
+        )
         
         try:
-            response = self.session.get(url, headers=headers, params=params, timeout=30)
-            result = response.json() if response.text else {}
+            async with self._get_session().get(url, headers=headers, params=params) as response:
+                content = await response.read()
+            result = json_loads(content) if content else {}
             
             if result.get("code") in ["0", "000000"]:
                 return result.get("data")
             
             return None
             
-        except requests.exceptions.SSLError as ssl_err:
+        except aiohttp.ClientSSLError as ssl_err:
             _LOGGER.error("SSL error getting vehicle data: %s", ssl_err)
             return None
-        except requests.exceptions.ConnectionError as conn_err:
-            _LOGGER.error("Connection error getting vehicle data: %s", conn_err)
-            return None
-        except requests.exceptions.Timeout as timeout_err:
+        except TimeoutError as timeout_err:
             _LOGGER.error("Timeout error getting vehicle data: %s", timeout_err)
             return None
-        except requests.exceptions.JSONDecodeError as json_err:
+        except aiohttp.ClientConnectionError as conn_err:
+            _LOGGER.error("Connection error getting vehicle data: %s", conn_err)
+            return None
+        except ValueError as json_err:
             _LOGGER.error("JSON decode error getting vehicle data: %s", json_err)
             return None
-        except (requests.exceptions.RequestException, ValueError) as exc:
+        except aiohttp.ClientError as exc:
             _LOGGER.exception("Unexpected error getting vehicle data: %s", exc)
             return None
 
-    def get_vehicles_list(self) -> Optional[Dict[str, object]]:
+    async def login_and_get_vehicle(
+        self, email: str, password: str, vin: str
+    ) -> Optional[Dict[str, object]]:
+        """Login and fetch vehicle information."""
+        if not await self.login(email, password):
+            return None
+        return await self.get_vehicle_by_vin(vin)
+
+    async def get_vehicles_list(self) -> Optional[Dict[str, object]]:
         """Get list of bound vehicles."""
         if not self.access_token:
             return None
         
-        url = f"{self.base_url}app-api/api/v1.0/vehicle/acquireVehicles"
+        url, path_string = self._endpoints["vehicles"]
         
-        signature_headers = self.generate_signature_headers("GET", url)
-        additional_headers = self.get_additional_headers()
-        headers = {**signature_headers, **additional_headers}
+        headers = self._request_headers(
+            self._signature_headers("GET", path_string)
+        )
         
         try:
-            response = self.session.get(url, headers=headers, timeout=30)
-            result = response.json() if response.text else {}
+            async with self._get_session().get(url, headers=headers) as response:
+                content = await response.read()
+            result = json_loads(content) if content else {}
             
             if result.get("code") in ["0", "000000"]:
                 return result
             
             return None
             
-        except requests.exceptions.SSLError as ssl_err:
+        except aiohttp.ClientSSLError as ssl_err:
             _LOGGER.error("SSL error getting vehicles list: %s", ssl_err)
             return None
-        except requests.exceptions.ConnectionError as conn_err:
-            _LOGGER.error("Connection error getting vehicles list: %s", conn_err)
-            return None
-        except requests.exceptions.Timeout as timeout_err:
+        except TimeoutError as timeout_err:
             _LOGGER.error("Timeout error getting vehicles list: %s", timeout_err)
             return None
-        except requests.exceptions.JSONDecodeError as json_err:
+        except aiohttp.ClientConnectionError as conn_err:
+            _LOGGER.error("Connection error getting vehicles list: %s", conn_err)
+            return None
+        except ValueError as json_err:
             _LOGGER.error("JSON decode error getting vehicles list: %s", json_err)
             return None
-        except (requests.exceptions.RequestException, ValueError) as exc:
+        except aiohttp.ClientError as exc:
             _LOGGER.exception("Unexpected error getting vehicles list: %s", exc)
             return None
 
-    # get_vehicle_model_by_vin не используется
-
     def parse_vehicle_items(self, items) -> Dict[str, object]:
         """Parse vehicle items data with full code interpretation."""
-        info = {
-            # Основные параметры
-            'battery_12v_level': None,      # 2013005 - Уровень заряда 12V батареи
-            'fuel_volume': None,            # 2017002 - Объем топлива
-            'mileage': None,                # 2103010 - Общий пробег
-            'fuel_range': None,             # 2011007 - Запас хода на топливе
-            
-            # Шины
-            'tire_pressure_fl': None,      # 2101001 - Передняя левая
-            'tire_pressure_fr': None,      # 2101002 - Передняя правая  
-            'tire_pressure_rl': None,      # 2101003 - Задняя левая
-            'tire_pressure_rr': None,      # 2101004 - Задняя правая
-            'tire_temp_fl': None,          # 2101005 - Температура передней левой
-            'tire_temp_fr': None,          # 2101006 - Температура передней правой
-            'tire_temp_rl': None,          # 2101007 - Температура задней левой
-            'tire_temp_rr': None,          # 2101008 - Температура задней правой
-            'tire_pressure_alarm_fl': None, # 2102001 - Авария давления передней левой
-            'tire_pressure_alarm_fr': None, # 2102002 - Авария давления передней правой
-            'tire_pressure_alarm_rl': None, # 2102003 - Авария давления задней левой
-            'tire_pressure_alarm_rr': None, # 2102004 - Авария давления задней правой
-            'tire_temp_alarm_fl': None,    # 2102007 - Авария температуры передней левой
-            'tire_temp_alarm_fr': None,    # 2102008 - Авария температуры передней правой
-            'tire_temp_alarm_rl': None,    # 2102009 - Авария температуры задней левой
-            'tire_temp_alarm_rr': None,    # 2102010 - Авария температуры задней правой
-            
-            # Состояние автомобиля
-            'engine_state': None,          # 2016001 - Состояние двигателя
-            'doors_locked': None,          # 2208001 - Замки дверей
-            'door_trunk': None,            # 2206001 - Багажник
-            'door_front_left': None,       # 2206002 - Передняя левая дверь
-            'door_rear_left': None,        # 2206003 - Задняя левая дверь
-            'door_front_right': None,      # 2206004 - Передняя правая дверь
-            'door_rear_right': None,       # 2206005 - Задняя правая дверь
-            'hood': None,                  # 2212001 - Капот
-            
-            # Климат и комфорт
-            'air_conditioner': None,       # 2202001 - Кондиционер
-            'front_defroster': None,       # 2222001 - Обогрев/обдув лобового стекла
-            'sunroof_position': None,      # 2210005 - Позиция люка
-            # seat_heat — не используется в интеграции
-            
-            # Система
-            'gps_authorized': None,        # 2310001 - Авторизация GPS
-            'signal_strength': None,       # 4105008 - Мощность сигнала сети
-        }
+        info = dict.fromkeys(_INFO_KEYS)
         
         for item in items:
-            code = item.get('code', '')
+            # Неизвестные коды — пропускаем
+            spec = _CODE_MAP.get(item.get('code', ''))
+            if spec is None:
+                continue
             value = item.get('value', '')
             # unit присутствует в item, но не используется интеграцией
             
-            # Преобразуем значение в нужный тип
-            if isinstance(value, str) and value.isdigit():
-                numeric_value = int(value)
-            elif isinstance(value, (int, float)):
+            # Преобразуем значение в нужный тип: int() разбирает str и int за один вызов
+            if isinstance(value, float):
                 numeric_value = value
             else:
-                numeric_value = value
+                try:
+                    numeric_value = int(value)
+                except (TypeError, ValueError):
+                    numeric_value = value
             
-            # Основные параметры
-            if code == '2013005':
-                info['battery_12v_level'] = numeric_value
-            elif code == '2017002':
-                info['fuel_volume'] = numeric_value  
-            elif code == '2103010':
-                info['mileage'] = numeric_value
-            elif code == '2011007':
-                info['fuel_range'] = numeric_value
-                
-            # Давление в шинах
-            elif code == '2101001':
-                info['tire_pressure_fl'] = numeric_value
-            elif code == '2101002':
-                info['tire_pressure_fr'] = numeric_value
-            elif code == '2101003':
-                info['tire_pressure_rl'] = numeric_value
-            elif code == '2101004':
-                info['tire_pressure_rr'] = numeric_value
-                
-            # Температура шин
-            elif code == '2101005':
-                info['tire_temp_fl'] = numeric_value
-            elif code == '2101006':
-                info['tire_temp_fr'] = numeric_value
-            elif code == '2101007':
-                info['tire_temp_rl'] = numeric_value
-            elif code == '2101008':
-                info['tire_temp_rr'] = numeric_value
-            elif code == '2102001':
-                info['tire_pressure_alarm_fl'] = numeric_value == 1
-            elif code == '2102002':
-                info['tire_pressure_alarm_fr'] = numeric_value == 1
-            elif code == '2102003':
-                info['tire_pressure_alarm_rl'] = numeric_value == 1
-            elif code == '2102004':
-                info['tire_pressure_alarm_rr'] = numeric_value == 1
-            elif code == '2102007':
-                info['tire_temp_alarm_fl'] = numeric_value == 1
-            elif code == '2102008':
-                info['tire_temp_alarm_fr'] = numeric_value == 1
-            elif code == '2102009':
-                info['tire_temp_alarm_rl'] = numeric_value == 1
-            elif code == '2102010':
-                info['tire_temp_alarm_rr'] = numeric_value == 1
-                
-            # Состояние автомобиля
-            elif code == '2016001':
-                info['engine_state'] = numeric_value
-            elif code == '2208001':
-                # По факту на ТANK 300: 0 = заблокированы, 1 = разблокированы
-                info['doors_locked'] = numeric_value == 0
-            elif code == '2206001':
-                info['door_trunk'] = numeric_value == 1    # 1=открыт, 0=закрыт
-            elif code == '2206002':
-                info['door_front_left'] = numeric_value == 1
-            elif code == '2206003':
-                info['door_rear_left'] = numeric_value == 1
-            elif code == '2206004':
-                info['door_front_right'] = numeric_value == 1
-            elif code == '2206005':
-                info['door_rear_right'] = numeric_value == 1
-            elif code == '2212001':
-                info['hood'] = numeric_value == 1
-                
-            # Климат и комфорт
-            elif code == '2202001':
-                info['air_conditioner'] = numeric_value == 1
-            elif code == '2222001':
-                info['front_defroster'] = numeric_value == 1
-            elif code == '2210005':
-                if numeric_value == 3:
-                    info['sunroof_position'] = 0  # Закрыт
-                else:
-                    info['sunroof_position'] = numeric_value  # % открытия
-            # seat_heat — опускаем
-                
-            # Система
-            elif code == '2310001':
-                info['gps_authorized'] = numeric_value == 1
-            elif code == '4105008':
-                info['signal_strength'] = numeric_value
-                
-            # Неизвестные коды — пропускаем
+            key, transform = spec
+            info[key] = transform(numeric_value)
         
         return info
@@ -1,8 +1,7 @@
 """Sensor platform for GWM Car Info."""
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any
+import sys
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -25,9 +24,33 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
+    ENGINE_STATE_MAP,
+    SERVICE_STATUS_MAP,
     VERSION,
 )
 
+# Позиции шин: передняя/задняя, левая/правая
+_TIRE_POSITIONS = ("fl", "fr", "rl", "rr")
+
+# Иконки состояния двигателя по коду (токены — ENGINE_STATE_MAP в const)
+_ENGINE_ICON_MAP: dict[int, str] = {
+    0: "mdi:engine-off",
+    1: "mdi:engine-outline",
+    2: "mdi:engine",
+}
+
+# Иконки статуса сервиса по коду (токены — SERVICE_STATUS_MAP в const)
+_SERVICE_STATUS_ICON_MAP: dict[int, str] = {1: "mdi:car-connected"}
+
+# Иконка уровня сигнала по индексу 0..4 (значение ограничивается этим диапазоном)
+_SIGNAL_ICONS = (
+    "mdi:signal-off",
+    "mdi:signal-variant",
+    "mdi:signal-2g",
+    "mdi:signal-3g",
+    "mdi:signal",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -37,7 +60,7 @@ async def async_setup_entry(
     """Set up the sensor platform."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    entities = [
+    entities = (
         # Основные параметры
         GWMBattery12VSensor(coordinator, config_entry),
         GWMFuelVolumeSensor(coordinator, config_entry),
@@ -50,24 +73,19 @@ async def async_setup_entry(
         GWMSignalStrengthSensor(coordinator, config_entry),
         GWMEngineStateSensor(coordinator, config_entry),
         
-        # Шины - давление
-        GWMTirePressureSensor(coordinator, config_entry, "fl"),
-        GWMTirePressureSensor(coordinator, config_entry, "fr"),
-        GWMTirePressureSensor(coordinator, config_entry, "rl"),
-        GWMTirePressureSensor(coordinator, config_entry, "rr"),
-        
-        # Шины - температура
-        GWMTireTemperatureSensor(coordinator, config_entry, "fl"),
-        GWMTireTemperatureSensor(coordinator, config_entry, "fr"),
-        GWMTireTemperatureSensor(coordinator, config_entry, "rl"),
-        GWMTireTemperatureSensor(coordinator, config_entry, "rr"),
+        # Шины - давление и температура по каждой позиции
+        *(
+            sensor_cls(coordinator, config_entry, position)
+            for sensor_cls in (GWMTirePressureSensor, GWMTireTemperatureSensor)
+            for position in _TIRE_POSITIONS
+        ),
         
         # Люк
         GWMSunroofSensor(coordinator, config_entry),
         
         # Время последнего обновления
         GWMLastUpdateSensor(coordinator, config_entry),
-    ]
+    )
     
     async_add_entities(entities)
 
@@ -75,334 +93,258 @@ async def async_setup_entry(
 class GWMSensorBase(CoordinatorEntity, SensorEntity):
     """Base class for GWM sensors."""
 
+    _attr_has_entity_name = True
+    # Ключ значения в плоских данных координатора (см. coordinator.value)
+    _key: str
+    # Общие атрибуты (VIN/Model/Lat/Lon/Update time) не дублируем — они есть
+    # в device_tracker с локализованными подписями
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.config_entry = config_entry
-        self._attr_has_entity_name = True
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.vin)},
-            name=f"GWM {self.coordinator.model}",
+        # DeviceInfo не меняется за время жизни записи — собираем один раз
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.vin)},
+            name=f"GWM {coordinator.model}",
             manufacturer="GWM",
-            model=self.coordinator.model,
+            model=coordinator.model,
             sw_version=VERSION,
         )
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes.
-        Убираем дублирующие общий атрибуты (VIN/Model/Lat/Lon/Update time),
-        они доступны в device_tracker с локализованными подписями.
+    def available(self) -> bool:
+        """Return if entity is available.
+
+        Без данных координатора сущность недоступна, и HA не запрашивает
+        native_value — отдельные проверки в свойствах не нужны.
         """
-        return {}
+        return super().available and self.coordinator.data is not None
+
+    @property
+    def native_value(self) -> int | float | None:
+        """Return the state of the sensor."""
+        return self.coordinator.value(self._key)
 
 
 # Основные параметры
 class GWMBattery12VSensor(GWMSensorBase):
     """12V battery level sensor."""
 
+    _attr_translation_key = "battery_12v"
+    _attr_device_class = SensorDeviceClass.BATTERY
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_icon = "mdi:car-battery"
+    _key = "battery_12v_level"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_battery_12v"
-        self._attr_translation_key = "battery_12v"
-        self._attr_device_class = SensorDeviceClass.BATTERY
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_icon = "mdi:car-battery"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get("battery_12v_level")
 
 
 class GWMFuelVolumeSensor(GWMSensorBase):
     """Fuel volume sensor."""
 
+    _attr_translation_key = "fuel_volume"
+    _attr_device_class = SensorDeviceClass.VOLUME
+    _attr_state_class = None  # Volume не поддерживает measurement
+    _attr_native_unit_of_measurement = UnitOfVolume.LITERS
+    _attr_icon = "mdi:gas-station"
+    _key = "fuel_volume"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_fuel_volume"
-        self._attr_translation_key = "fuel_volume"
-        self._attr_device_class = SensorDeviceClass.VOLUME
-        self._attr_state_class = None  # Volume не поддерживает measurement
-        self._attr_native_unit_of_measurement = UnitOfVolume.LITERS
-        self._attr_icon = "mdi:gas-station"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get("fuel_volume")
 
 
 class GWMMileageSensor(GWMSensorBase):
     """Mileage sensor."""
 
+    _attr_translation_key = "mileage"
+    _attr_device_class = SensorDeviceClass.DISTANCE
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
+    _attr_icon = "mdi:counter"
+    _key = "mileage"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_mileage"
-        self._attr_translation_key = "mileage"
-        self._attr_device_class = SensorDeviceClass.DISTANCE
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
-        self._attr_icon = "mdi:counter"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get("mileage")
 
 
 class GWMFuelRangeSensor(GWMSensorBase):
     """Fuel range sensor."""
 
+    _attr_translation_key = "fuel_range"
+    _attr_device_class = SensorDeviceClass.DISTANCE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
+    _attr_icon = "mdi:map-marker-distance"
+    _key = "fuel_range"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_fuel_range"
-        self._attr_translation_key = "fuel_range"
-        self._attr_device_class = SensorDeviceClass.DISTANCE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
-        self._attr_icon = "mdi:map-marker-distance"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get("fuel_range")
 
 
 # Система
 class GWMServiceStatusSensor(GWMSensorBase):
     """Service status sensor."""
 
+    _attr_translation_key = "service_status"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:car-connected"
+    _key = "service_status"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_service_status"
-        self._attr_translation_key = "service_status"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_icon = "mdi:car-connected"
 
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        
-        status = self.coordinator.data.get("service_status")
-        return "active" if status == 1 else "inactive" if status == 0 else "unknown"
+        return SERVICE_STATUS_MAP.get(self.coordinator.value(self._key), "unknown")
 
     @property
     def icon(self) -> str:
         """Return the icon."""
-        if not self.coordinator.data:
-            return "mdi:car-off"
-        
-        status = self.coordinator.data.get("service_status")
-        return "mdi:car-connected" if status == 1 else "mdi:car-off"
-
+        return _SERVICE_STATUS_ICON_MAP.get(
+            self.coordinator.value(self._key), "mdi:car-off"
+        )
 
 
 class GWMSignalStrengthSensor(GWMSensorBase):
     """Signal strength sensor."""
 
+    _attr_translation_key = "signal_strength"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:signal"
+    _key = "signal_strength"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_signal_strength"
-        self._attr_translation_key = "signal_strength"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_icon = "mdi:signal"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get("signal_strength")
 
     @property
     def icon(self) -> str:
         """Return the icon based on signal strength."""
-        if not self.coordinator.data:
-            return "mdi:signal-off"
-        
-        strength = self.coordinator.data.get("parsed_data", {}).get("signal_strength")
+        strength = self.coordinator.value(self._key)
         if strength is None:
             return "mdi:signal-off"
-        
-        if strength >= 4:
-            return "mdi:signal"
-        elif strength >= 3:
-            return "mdi:signal-3g"
-        elif strength >= 2:
-            return "mdi:signal-2g"
-        elif strength >= 1:
-            return "mdi:signal-variant"
-        else:
-            return "mdi:signal-off"
+        return _SIGNAL_ICONS[int(min(max(strength, 0), 4))]
 
 
 class GWMEngineStateSensor(GWMSensorBase):
     """Engine state sensor."""
 
+    _attr_translation_key = "engine_state"
+    _attr_icon = "mdi:engine"
+    _key = "engine_state"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_engine_state"
-        self._attr_translation_key = "engine_state"
-        self._attr_icon = "mdi:engine"
 
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        
-        state = self.coordinator.data.get("parsed_data", {}).get("engine_state")
-        if state == 0:
-            return "off"
-        elif state == 1:
-            return "starting"
-        elif state == 2:
-            return "running"
-        else:
-            return f"unknown_{state}"
+        state = self.coordinator.value(self._key)
+        return ENGINE_STATE_MAP.get(state) or f"unknown_{state}"
 
     @property
     def icon(self) -> str:
         """Return the icon."""
-        if not self.coordinator.data:
-            return "mdi:engine-off"
-        
-        state = self.coordinator.data.get("parsed_data", {}).get("engine_state", 0)
-        if state == 2:
-            return "mdi:engine"  # running
-        elif state == 1:
-            return "mdi:engine-outline"  # starting
-        else:
-            return "mdi:engine-off"  # off
+        state = self.coordinator.value(self._key)
+        return _ENGINE_ICON_MAP.get(state, "mdi:engine-off")
 
 
 # Шины
 class GWMTirePressureSensor(GWMSensorBase):
     """Tire pressure sensor."""
 
+    _attr_device_class = SensorDeviceClass.PRESSURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfPressure.KPA
+    _attr_icon = "mdi:car-tire-alert"
+
+    # Ключ parsed_data по позиции; он же translation_key и суффикс unique_id
+    _KEYS = {p: sys.intern(f"tire_pressure_{p}") for p in _TIRE_POSITIONS}
+
     def __init__(self, coordinator, config_entry: ConfigEntry, position: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
-        self.position = position
-        self._attr_unique_id = f"{coordinator.vin}_tire_pressure_{position}"
-        self._attr_translation_key = f"tire_pressure_{position}"
-        self._attr_device_class = SensorDeviceClass.PRESSURE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = UnitOfPressure.KPA
-        self._attr_icon = "mdi:car-tire-alert"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get(f"tire_pressure_{self.position}")
+        self._key = self._KEYS[position]
+        self._attr_unique_id = f"{coordinator.vin}_{self._key}"
+        self._attr_translation_key = self._key
 
 
 class GWMTireTemperatureSensor(GWMSensorBase):
     """Tire temperature sensor."""
 
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_icon = "mdi:thermometer"
+
+    # Ключ parsed_data по позиции; он же translation_key и суффикс unique_id
+    _KEYS = {p: sys.intern(f"tire_temp_{p}") for p in _TIRE_POSITIONS}
+
     def __init__(self, coordinator, config_entry: ConfigEntry, position: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
-        self.position = position
-        self._attr_unique_id = f"{coordinator.vin}_tire_temp_{position}"
-        self._attr_translation_key = f"tire_temp_{position}"
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        self._attr_icon = "mdi:thermometer"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get(f"tire_temp_{self.position}")
+        self._key = self._KEYS[position]
+        self._attr_unique_id = f"{coordinator.vin}_{self._key}"
+        self._attr_translation_key = self._key
 
 
 class GWMSunroofSensor(GWMSensorBase):
     """Sunroof position sensor."""
 
+    _attr_translation_key = "sunroof"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_icon = "mdi:car-roof"
+    _key = "sunroof_position"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_sunroof"
-        self._attr_translation_key = "sunroof"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_icon = "mdi:car-roof"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("parsed_data", {}).get("sunroof_position")
 
     @property
     def icon(self) -> str:
         """Return the icon."""
-        if not self.coordinator.data:
-            return "mdi:car-roof"
-        
-        position = self.coordinator.data.get("parsed_data", {}).get("sunroof_position", 0)
+        position = self.coordinator.value(self._key)
         return "mdi:car-roof" if position == 0 else "mdi:shield-sun"
 
 
 class GWMLastUpdateSensor(GWMSensorBase):
     """Last update time sensor."""
 
+    _attr_translation_key = "last_update"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:clock-outline"
+    # datetime готовится координатором один раз на обновление (build_data)
+    _key = "last_update_dt"
+
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry)
         self._attr_unique_id = f"{coordinator.vin}_last_update"
-        self._attr_translation_key = "last_update"
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_icon = "mdi:clock-outline"
-
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        
-        timestamp = self.coordinator.data.get("update_time")
-        if timestamp:
-            try:
-                return datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc)
-            except (ValueError, TypeError):
-                return None
-        return None
 
     @property
     def icon(self) -> str:
         """Return the icon."""
-        if not self.coordinator.data or not self.coordinator.last_update_success:
+        if not self.available:
             return "mdi:clock-alert-outline"
         return "mdi:clock-check-outline"
\ No newline at end of file
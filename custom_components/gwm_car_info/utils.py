@@ -1,11 +1,63 @@
 """Common utilities for GWM Car Info integration."""
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import contextlib
+import functools
+import logging
+import os
+import uuid
+from datetime import datetime, tzinfo
 from typing import Optional
 
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
+from .const import DEVICE_ID_STORAGE_KEY, LEGACY_DEVICE_ID_FILE, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_load_device_id(hass: HomeAssistant) -> str:
+    """Load the shared device ID from storage, migrating or generating it once."""
+    # Повторные клиенты (config flow, перезагрузка записи) не читают .storage заново
+    if cached := hass.data.get(DEVICE_ID_STORAGE_KEY):
+        return cached
+
+    store = Store(hass, STORAGE_VERSION, DEVICE_ID_STORAGE_KEY)
+    data = await store.async_load()
+    device_id = (data or {}).get("device_id")
+    if not device_id:
+        legacy_path = hass.config.path(LEGACY_DEVICE_ID_FILE)
+        device_id = await hass.async_add_executor_job(_read_legacy_device_id, legacy_path)
+        if device_id:
+            _LOGGER.debug("Migrating device_id from %s", legacy_path)
+            await store.async_save({"device_id": device_id})
+            # Старый файл удаляем только после успешного переноса в Store
+            await hass.async_add_executor_job(_remove_file, legacy_path)
+        else:
+            device_id = uuid.uuid4().hex
+            _LOGGER.info("Generated new device_id: %s", device_id[:8] + "...")
+            await store.async_save({"device_id": device_id})
+
+    hass.data[DEVICE_ID_STORAGE_KEY] = device_id
+    return device_id
+
+
+def _read_legacy_device_id(path: str) -> str | None:
+    """Read the device ID from the legacy txt file (blocking)."""
+    try:
+        with open(path, encoding="utf-8") as file:
+            return file.read().strip() or None
+    except OSError:
+        return None
+
+
+def _remove_file(path: str) -> None:
+    """Remove a file if it exists (blocking)."""
+    with contextlib.suppress(OSError):
+        os.remove(path)
+
 
 def format_timestamp_local(timestamp: Optional[int]) -> str | None:
     """Format millisecond timestamp to local time string.
@@ -15,9 +67,23 @@ def format_timestamp_local(timestamp: Optional[int]) -> str | None:
     if not timestamp:
         return None
     try:
-        dt = datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc)
-        local_dt = dt_util.as_local(dt)
-        return local_dt.strftime("%Y-%m-%d %H:%M:%S")
-    except (ValueError, TypeError):
+        return _format_timestamp(timestamp, dt_util.DEFAULT_TIME_ZONE)
+    except TypeError:
+        # Нехешируемое значение — заведомо не timestamp
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _format_timestamp(timestamp: int, time_zone: tzinfo) -> str | None:
+    """Format a millisecond timestamp; repeated calls for the same value are cached.
+
+    The time zone is part of the cache key so a changed HA time zone is honoured.
+    """
+    try:
+        # Целочисленное деление: без float-округления; миллисекунды в формат не входят
+        seconds, _ = divmod(timestamp, 1000)
+        # Сразу локальный datetime: без промежуточного UTC и второй конвертации
+        return datetime.fromtimestamp(seconds, tz=time_zone).strftime("%Y-%m-%d %H:%M:%S")
+    except (ValueError, TypeError, OverflowError, OSError):
         return None
 